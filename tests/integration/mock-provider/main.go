@@ -7,21 +7,27 @@ import (
 )
 
 func main() {
-	http.HandleFunc("/graphql", func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-
-		response := map[string]interface{}{
-			"data": map[string]interface{}{
-				"person": map[string]interface{}{
-					"email":      "test@example.com",
-					"fullName":   "John Doe",
-					"address":    "123 Test St",
-					"profession": "Tester",
-				},
+	// The response is static, so encode it once at startup instead of on every request.
+	response := map[string]interface{}{
+		"data": map[string]interface{}{
+			"person": map[string]interface{}{
+				"email":      "test@example.com",
+				"fullName":   "John Doe",
+				"address":    "123 Test St",
+				"profession": "Tester",
 			},
-		}
+		},
+	}
 
-		json.NewEncoder(w).Encode(response)
+	body, err := json.Marshal(response)
+	if err != nil {
+		log.Fatal(err)
+	}
+	body = append(body, '\n')
+
+	http.HandleFunc("/graphql", func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		w.Write(body)
 	})
 
 	log.Println("Mock Provider listening on :8083")